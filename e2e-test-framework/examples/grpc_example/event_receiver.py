@@ -0,0 +1,135 @@
+# Copyright 2025 The Drasi Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio HTTP receiver for source change events.
+
+Accepts the JSON bodies POSTed by the Http source change dispatcher and
+prints each event to stdout. Built on aiohttp so concurrent dispatches are
+pipelined on one event loop instead of being serialized per request, and
+logging is drained by a dedicated task so stdout I/O never blocks request
+handling.
+
+Usage:
+    python event_receiver.py [--port 9000]
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+from aiohttp import web
+
+# orjson parses bytes directly (no separate UTF-8 decode pass) and is
+# several times faster than stdlib json on large batch bodies; fall back
+# to stdlib when it is not installed.
+try:
+    import orjson
+
+    def _loads(body: bytes):
+        return orjson.loads(body)
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _DecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def _loads(body: bytes):
+        return json.loads(body)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _DecodeError = json.JSONDecodeError
+
+# Formatted log strings are pushed here by request handlers and drained by
+# the logger task, so a slow stdout never stalls an in-flight request.
+_log_queue: asyncio.Queue = asyncio.Queue()
+
+# The success body never varies; serializing it per request would be
+# pure overhead at high request rates. (Response objects themselves
+# cannot be reused across requests, but the bytes can.)
+_OK_BODY = b'{"status": "ok"}'
+
+
+async def _logger_task() -> None:
+    """Drain the log queue to stdout, one write per entry."""
+    while True:
+        entry = await _log_queue.get()
+        sys.stdout.write(entry)
+        sys.stdout.flush()
+        _log_queue.task_done()
+
+
+def _format_events(path: str, data) -> str:
+    """Format a decoded request body (event or list of events) for logging."""
+    events = data if isinstance(data, list) else [data]
+    lines = [
+        f"\n=== {datetime.now().isoformat()} POST {path} "
+        f"({len(events)} event(s)) ===",
+    ]
+    for event in events:
+        lines.append(_dumps_pretty(event))
+    lines.append("")
+    return "\n".join(lines)
+
+
+async def handle(request: web.Request) -> web.Response:
+    """Handle a POSTed batch of source change events."""
+    # Read the payload stream directly: unlike request.read(), this does
+    # not cache a second copy of the body on the request, and the raw
+    # bytes go straight to the JSON parser with no UTF-8 decode pass -
+    # both matter for MB-sized batch POSTs.
+    body = await request.content.read()
+    try:
+        data = _loads(body)
+    except (_DecodeError, UnicodeDecodeError) as e:
+        await _log_queue.put(f"Failed to decode request body: {e}\n")
+        return web.json_response(
+            {"status": "error", "message": str(e)}, status=400
+        )
+
+    await _log_queue.put(_format_events(request.path, data))
+    return web.Response(body=_OK_BODY, content_type="application/json")
+
+
+async def _start_logger(app: web.Application) -> None:
+    app["logger_task"] = asyncio.create_task(_logger_task())
+
+
+async def _stop_logger(app: web.Application) -> None:
+    await _log_queue.join()
+    app["logger_task"].cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="HTTP receiver for source change events"
+    )
+    parser.add_argument("--port", type=int, default=9000)
+    args = parser.parse_args()
+
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", handle)
+    app.on_startup.append(_start_logger)
+    app.on_cleanup.append(_stop_logger)
+
+    print(f"Event receiver listening on http://0.0.0.0:{args.port}")
+    web.run_app(app, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
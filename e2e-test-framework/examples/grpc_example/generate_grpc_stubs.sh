@@ -0,0 +1,37 @@
+# Copyright 2025 The Drasi Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/bin/bash
+
+# Generates the drasi.v1 Python stubs used by the example scripts from
+# the protos shipped with test-run-host. Run once before starting the
+# receivers or clients; the scripts fail fast at import if the stubs are
+# missing rather than generating them on the fly.
+#
+# Requires grpcio-tools: pip install grpcio-tools
+
+set -euo pipefail
+cd "$(dirname "$0")"
+
+PROTO_DIR=../../test-run-host/proto
+
+python -m grpc_tools.protoc \
+    -I "$PROTO_DIR" \
+    --python_out=. \
+    --grpc_python_out=. \
+    "$PROTO_DIR"/drasi/v1/common.proto \
+    "$PROTO_DIR"/drasi/v1/source.proto \
+    "$PROTO_DIR"/drasi/v1/reaction.proto
+
+echo "Generated drasi.v1 stubs in $(pwd)/drasi/v1"
@@ -0,0 +1,123 @@
+# Copyright 2025 The Drasi Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Minimal thread-pool gRPC receiver for drasi.v1.SourceService.
+
+A simpler, synchronous alternative to grpc_event_receiver_proper.py for
+quick inspection of dispatched events. Prints one compact line per event
+and accesses message fields defensively so it keeps working across proto
+revisions.
+
+Usage:
+    python grpc_event_receiver.py [--port 50051]
+"""
+
+import argparse
+import os
+from concurrent import futures
+from datetime import datetime
+
+import grpc
+
+try:
+    from drasi.v1 import source_pb2, source_pb2_grpc
+except ImportError as e:
+    raise ImportError(
+        "drasi.v1 stubs not found - run ./generate_grpc_stubs.sh first"
+    ) from e
+
+
+class SourceServiceServicer(source_pb2_grpc.SourceServiceServicer):
+    """Prints a one-line summary per received event."""
+
+    def _describe(self, change) -> str:
+        # Single lookups only: hasattr runs the full attribute lookup and
+        # would be followed by a second one to read the value, doubling
+        # the descriptor work per event in this hot path.
+        parts = [
+            datetime.now().isoformat(),
+            f"source={getattr(change, 'source_id', 'unknown')}",
+            f"type={getattr(change, 'type', '?')}",
+        ]
+        try:
+            which = change.WhichOneof("change")
+        except ValueError:
+            which = None
+        if which == "element":
+            element = change.element
+            kind = element.WhichOneof("element")
+            if kind:
+                reference = getattr(element, kind).metadata.reference
+                parts.append(f"{kind}={reference.element_id}")
+        elif which == "metadata":
+            parts.append(f"deleted={change.metadata.reference.element_id}")
+        return " ".join(parts)
+
+    def SubmitEvent(self, request, context):
+        print(f"SubmitEvent: {self._describe(request.event)}")
+        return source_pb2.SubmitEventResponse(
+            success=True, message="Event received"
+        )
+
+    def StreamEvents(self, request_iterator, context):
+        events_processed = 0
+        for change in request_iterator:
+            print(f"StreamEvents[{events_processed}]: {self._describe(change)}")
+            events_processed += 1
+        yield source_pb2.StreamEventResponse(
+            success=True,
+            message=f"Processed {events_processed} event(s)",
+            events_processed=events_processed,
+        )
+
+    def HealthCheck(self, request, context):
+        return source_pb2.HealthCheckResponse(
+            status=source_pb2.HealthCheckResponse.STATUS_HEALTHY,
+            message="ok",
+        )
+
+
+def serve(port: int) -> None:
+    # Sized like the stdlib ThreadPoolExecutor default: handlers are
+    # I/O-bound (stdout writes), so more threads than cores still helps
+    # despite the GIL, while a hardcoded small pool would queue the 11th
+    # concurrent RPC and an unbounded one would explode under bursts.
+    workers = int(os.environ.get("GRPC_DISPATCH_WORKERS", "0")) or min(
+        32, (os.cpu_count() or 1) * 5
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="grpc-dispatch"
+        )
+    )
+    source_pb2_grpc.add_SourceServiceServicer_to_server(
+        SourceServiceServicer(), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    server.start()
+    print(f"SourceService receiver listening on port {port} ({workers} workers)")
+    server.wait_for_termination()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Minimal gRPC receiver for drasi.v1.SourceService"
+    )
+    parser.add_argument("--port", type=int, default=50051)
+    args = parser.parse_args()
+    serve(args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# Copyright 2025 The Drasi Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""gRPC receiver implementing drasi.v1.SourceService with generated stubs.
+
+Acts as the server side for the Grpc source change dispatcher: the test
+framework connects as a drasi.v1.SourceService client and submits events
+via SubmitEvent (single) or StreamEvents (batched). Built on grpc.aio so
+many in-flight RPCs share one event loop instead of queueing behind a
+bounded thread pool.
+
+Generate the Python stubs from the protos in test-run-host/proto before
+running:
+
+    ./generate_grpc_stubs.sh
+
+Usage:
+    python grpc_event_receiver_proper.py [--port 50051]
+"""
+
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+import sys
+from datetime import datetime
+
+# Message decoding dominates CPU per RPC on this receiver; make sure the
+# native (upb) protobuf backend is selected before anything imports
+# google.protobuf, as the pure-Python fallback decodes batches an order
+# of magnitude slower.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import grpc
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() not in ("cpp", "upb"):
+    raise RuntimeError(
+        "protobuf is using the pure-Python backend; install protobuf>=4.25 "
+        "(see requirements.txt) for native message decoding"
+    )
+
+try:
+    from drasi.v1 import common_pb2, source_pb2, source_pb2_grpc
+except ImportError as e:
+    raise ImportError(
+        "drasi.v1 stubs not found - run ./generate_grpc_stubs.sh first"
+    ) from e
+
+
+@functools.lru_cache(maxsize=64)
+def _iso_from_ms(ts_ms: int) -> str:
+    """ISO string for a ms-resolution timestamp, memoized.
+
+    Events in one batch usually share near-identical timestamps, so
+    rounding to ms and caching turns N fromtimestamp/isoformat calls per
+    batch into one per distinct millisecond.
+    """
+    return datetime.fromtimestamp(ts_ms / 1000).isoformat(
+        timespec="milliseconds"
+    )
+
+
+class SourceServiceServicer(source_pb2_grpc.SourceServiceServicer):
+    """Receives source change events and prints them to stdout."""
+
+    def _format_event(self, change):
+        """Build the log lines for one event; caller emits them in one write.
+
+        Uses %-formatting for the per-event substitutions: it is handled
+        at C level, avoiding Python-side format-spec parsing per line.
+        """
+        timestamp = change.timestamp
+        lines = [
+            "  Type: %s" % common_pb2.ChangeType.Name(change.type),
+            "  Source ID: %s" % change.source_id,
+            "  Timestamp: %s"
+            % _iso_from_ms(timestamp.seconds * 1000 + timestamp.nanos // 1_000_000),
+        ]
+        if change.HasField("element"):
+            element = change.element
+            if element.HasField("node"):
+                metadata = element.node.metadata
+                properties = element.node.properties
+                kind = "Node"
+            else:
+                metadata = element.relation.metadata
+                properties = element.relation.properties
+                kind = "Relation"
+            lines.append("  %s ID: %s" % (kind, metadata.reference.element_id))
+            # Repeated scalar containers iterate without copying; joining
+            # directly avoids materializing a list per event just for repr.
+            lines.append("  Labels: [" + ", ".join(metadata.labels) + "]")
+            # Struct supports mapping-style iteration; indexing unwraps the
+            # Value, so no intermediate dict is materialized per event.
+            lines.append("  Properties:")
+            for key in properties:
+                lines.append("    %s: %s" % (key, properties[key]))
+            if element.HasField("relation"):
+                relation = element.relation
+                lines.append("  In Node: %s" % relation.in_node.element_id)
+                lines.append("  Out Node: %s" % relation.out_node.element_id)
+        elif change.HasField("metadata"):
+            metadata = change.metadata
+            lines.append("  Deleted ID: %s" % metadata.reference.element_id)
+            lines.append("  Labels: [" + ", ".join(metadata.labels) + "]")
+        return lines
+
+    async def SubmitEvent(self, request, context):
+        lines = [f"\n=== {datetime.now().isoformat()} SubmitEvent ==="]
+        lines.extend(self._format_event(request.event))
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        return source_pb2.SubmitEventResponse(
+            success=True, message="Event received"
+        )
+
+    async def StreamEvents(self, request_iterator, context):
+        sys.stdout.write(f"\n=== {datetime.now().isoformat()} StreamEvents ===\n")
+        events_processed = 0
+        # The stream is long-lived, so buffer per event rather than per
+        # RPC: each event's ~10 log lines still collapse into one write.
+        # Ack each event as it is processed instead of summarizing at
+        # stream end, so the dispatcher sees the first ack after the
+        # first event rather than after the whole batch. Clients sum
+        # events_processed across acks, so each ack carries the delta
+        # (1) and the running total rides in the free-text message.
+        async for change in request_iterator:
+            lines = ["--- Event %d ---" % events_processed]
+            lines.extend(self._format_event(change))
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            events_processed += 1
+            yield source_pb2.StreamEventResponse(
+                success=True,
+                message="Processed %d event(s)" % events_processed,
+                events_processed=1,
+            )
+
+    async def RequestBootstrap(self, request, context):
+        print(
+            f"\n=== {datetime.now().isoformat()} RequestBootstrap "
+            f"for query {request.query_id} ==="
+        )
+        # Test receiver holds no data; return an empty bootstrap.
+        yield common_pb2.BootstrapResponse(total_count=0)
+
+    async def HealthCheck(self, request, context):
+        return source_pb2.HealthCheckResponse(
+            status=source_pb2.HealthCheckResponse.STATUS_HEALTHY,
+            message="ok",
+        )
+
+
+async def serve(port: int) -> None:
+    # so_reuseport lets every worker process bind the same port and have
+    # the kernel load-balance incoming connections across them.
+    server = grpc.aio.server(options=[("grpc.so_reuseport", 1)])
+    source_pb2_grpc.add_SourceServiceServicer_to_server(
+        SourceServiceServicer(), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    print(f"SourceService receiver listening on port {port} (pid {os.getpid()})")
+    await server.wait_for_termination()
+
+
+def _run_worker(port: int) -> None:
+    asyncio.run(serve(port))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="gRPC receiver for drasi.v1.SourceService"
+    )
+    parser.add_argument("--port", type=int, default=50051)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("GRPC_RECEIVER_WORKERS", "0"))
+        or (os.cpu_count() or 1),
+        help="worker processes sharing the port (default: one per CPU)",
+    )
+    args = parser.parse_args()
+
+    # One interpreter cannot decode and format on more than one core, so
+    # scale across processes rather than threads.
+    if args.workers <= 1:
+        _run_worker(args.port)
+        return
+    workers = [
+        multiprocessing.Process(target=_run_worker, args=(args.port,))
+        for _ in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()